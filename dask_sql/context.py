@@ -1,20 +1,22 @@
 from typing import Any, Callable, Dict, List, Tuple, Union
-from collections import namedtuple
 import logging
+import sys
 import warnings
 
 import dask.dataframe as dd
+import jpype
 import pandas as pd
 
 from dask_sql.java import (
     DaskAggregateFunction,
+    DaskFunction,
     DaskScalarFunction,
     DaskSchema,
     DaskTable,
     RelationalAlgebraGenerator,
     SqlParseException,
+    SqlTypeName,
     ValidationException,
-    get_java_class,
 )
 from dask_sql import input_utils
 from dask_sql.input_utils import InputType, InputUtil
@@ -22,13 +24,51 @@ from dask_sql.mappings import python_to_sql_type
 from dask_sql.physical.rel import RelConverter, logical, custom
 from dask_sql.physical.rex import RexConverter, core
 from dask_sql.datacontainer import DataContainer
-from dask_sql.utils import ParsingException
+from dask_sql.utils import ParsingException, PlanCache
 
 logger = logging.getLogger(__name__)
 
-FunctionDescription = namedtuple(
-    "FunctionDescription", ["name", "parameters", "return_type", "aggregation"]
-)
+
+class FunctionDescription:
+    """
+    Description of a registered scalar function or aggregation.
+    The SQL types of the parameters and the return value are
+    already computed when registering the function,
+    so that they do not need to be calculated again
+    for every new schema.
+    """
+
+    __slots__ = (
+        "name",
+        "parameters",
+        "return_type",
+        "aggregation",
+        "sql_parameters",
+        "sql_return_type",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parameters: List[Tuple[str, type]],
+        return_type: type,
+        aggregation: bool,
+    ):
+        self.name = name
+        self.parameters = parameters
+        self.return_type = return_type
+        self.aggregation = aggregation
+
+        self.sql_parameters = [
+            (param_name, python_to_sql_type(param_type))
+            for param_name, param_type in parameters
+        ]
+        self.sql_return_type = python_to_sql_type(return_type)
+
+    def __deepcopy__(self, memo):
+        # The description is never changed after creation
+        # (and the SQL types are java objects, which can not be copied)
+        return self
 
 
 class Context:
@@ -77,38 +117,17 @@ class Context:
         self.models = {}
         # Name of the root schema (not changable so far)
         self.schema_name = "schema"
-
-        # Register any default plugins, if nothing was registered before.
-        RelConverter.add_plugin_class(logical.LogicalAggregatePlugin, replace=False)
-        RelConverter.add_plugin_class(logical.LogicalFilterPlugin, replace=False)
-        RelConverter.add_plugin_class(logical.LogicalJoinPlugin, replace=False)
-        RelConverter.add_plugin_class(logical.LogicalProjectPlugin, replace=False)
-        RelConverter.add_plugin_class(logical.LogicalSortPlugin, replace=False)
-        RelConverter.add_plugin_class(logical.LogicalTableScanPlugin, replace=False)
-        RelConverter.add_plugin_class(logical.LogicalUnionPlugin, replace=False)
-        RelConverter.add_plugin_class(logical.LogicalValuesPlugin, replace=False)
-        RelConverter.add_plugin_class(logical.SamplePlugin, replace=False)
-        RelConverter.add_plugin_class(custom.AnalyzeTablePlugin, replace=False)
-        RelConverter.add_plugin_class(custom.CreateModelPlugin, replace=False)
-        RelConverter.add_plugin_class(custom.CreateTableAsPlugin, replace=False)
-        RelConverter.add_plugin_class(custom.CreateTablePlugin, replace=False)
-        RelConverter.add_plugin_class(custom.PredictModelPlugin, replace=False)
-        RelConverter.add_plugin_class(custom.DropModelPlugin, replace=False)
-        RelConverter.add_plugin_class(custom.DropTablePlugin, replace=False)
-        RelConverter.add_plugin_class(custom.ShowColumnsPlugin, replace=False)
-        RelConverter.add_plugin_class(custom.ShowSchemasPlugin, replace=False)
-        RelConverter.add_plugin_class(custom.ShowTablesPlugin, replace=False)
-
-        RexConverter.add_plugin_class(core.RexCallPlugin, replace=False)
-        RexConverter.add_plugin_class(core.RexInputRefPlugin, replace=False)
-        RexConverter.add_plugin_class(core.RexLiteralPlugin, replace=False)
-
-        InputUtil.add_plugin_class(input_utils.DaskInputPlugin, replace=False)
-        InputUtil.add_plugin_class(input_utils.PandasInputPlugin, replace=False)
-        InputUtil.add_plugin_class(input_utils.HiveInputPlugin, replace=False)
-        InputUtil.add_plugin_class(input_utils.IntakeCatalogInputPlugin, replace=False)
-        # needs to be the last entry, as it only checks for string
-        InputUtil.add_plugin_class(input_utils.LocationInputPlugin, replace=False)
+        # Counter which is increased whenever the registered
+        # tables or functions change
+        self._schema_version = 0
+        # Cache for already converted SQL queries
+        self._plan_cache = PlanCache()
+        # The java schema is only rebuilt if the schema version changes
+        self._cached_schema = None
+        self._cached_schema_version = -1
+        # Same for the calcite generator
+        self._cached_generator = None
+        self._cached_generator_version = -1
 
     def create_table(
         self,
@@ -190,7 +209,10 @@ class Context:
             persist=persist,
             **kwargs,
         )
-        self.tables[table_name.lower()] = dc
+        # Table names are normalized once here, so that
+        # no lookup needs to do it again
+        self.tables[sys.intern(table_name.lower())] = dc
+        self._schema_changed()
 
     def register_dask_table(self, df: dd.DataFrame, name: str):
         """
@@ -212,6 +234,7 @@ class Context:
 
         """
         del self.tables[table_name]
+        self._schema_changed()
 
     def register_function(
         self,
@@ -267,17 +290,20 @@ class Context:
             :func:`register_aggregation`
 
         """
-        self.function_list.append(
-            FunctionDescription(name, parameters, return_type, False)
-        )
+        function_description = FunctionDescription(name, parameters, return_type, False)
 
-        name = name.lower()
+        name = sys.intern(name.lower())
         if name in self.functions:
             if self.functions[name] != f:
                 raise ValueError(
                     "Registering different functions with the same name is not allowed"
                 )
+
+        # Only store the description once it is accepted,
+        # so that the (cached) schema always matches the function list
+        self.function_list.append(function_description)
         self.functions[name] = f
+        self._schema_changed()
 
     def register_aggregation(
         self,
@@ -333,17 +359,20 @@ class Context:
             :func:`register_function`
 
         """
-        self.function_list.append(
-            FunctionDescription(name, parameters, return_type, True)
-        )
+        function_description = FunctionDescription(name, parameters, return_type, True)
 
-        name = name.lower()
+        name = sys.intern(name.lower())
         if name in self.functions:
             if self.functions[name] != f:
                 raise ValueError(
                     "Registering different functions with the same name is not allowed"
                 )
+
+        # Only store the description once it is accepted,
+        # so that the (cached) schema always matches the function list
+        self.function_list.append(function_description)
         self.functions[name] = f
+        self._schema_changed()
 
     def sql(
         self, sql: str, return_futures: bool = True
@@ -384,14 +413,16 @@ class Context:
 
         if select_names:
             # Rename any columns named EXPR$* to a more human readable name
+            # Only these columns need to be touched, all others can stay as they are
             cc = dc.column_container
-            cc = cc.rename(
-                {
-                    df_col: df_col if not df_col.startswith("EXPR$") else select_name
-                    for df_col, select_name in zip(cc.columns, select_names)
-                }
-            )
-            dc = DataContainer(dc.df, cc)
+            renames = {
+                df_col: select_name
+                for df_col, select_name in zip(cc.columns, select_names)
+                if df_col.startswith("EXPR$")
+            }
+            if renames:
+                cc = cc.rename(renames)
+                dc = dc.with_columns(cc)
 
         df = dc.assign()
         if not return_futures:
@@ -437,36 +468,52 @@ class Context:
         """
         self.models[model_name] = (model, training_columns)
 
+    def __getstate__(self):
+        # The cached plans are java objects, which can not be copied.
+        # A copy therefore starts with an empty cache.
+        state = self.__dict__.copy()
+        state["_plan_cache"] = PlanCache(self._plan_cache.maxsize)
+        state["_cached_schema"] = None
+        state["_cached_schema_version"] = -1
+        state["_cached_generator"] = None
+        state["_cached_generator_version"] = -1
+        return state
+
+    def _schema_changed(self):
+        """
+        Mark the registered tables or functions as changed,
+        which invalidates all cached plans.
+        """
+        self._schema_version += 1
+        self._plan_cache.clear()
+
     def _prepare_schema(self):
         """
         Create a schema filled with the dataframes
-        and functions we have currently in our list
+        and functions we have currently in our list.
+        As creating the schema is costly, it is cached
+        until the next registration changes the schema.
         """
+        if self._cached_schema_version == self._schema_version:
+            return self._cached_schema
+
         schema = DaskSchema(self.schema_name)
 
         if not self.tables:
             logger.warning("No tables are registered.")
 
-        for name, dc in self.tables.items():
-            table = DaskTable(name)
-            df = dc.df
-            logger.debug(
-                f"Adding table '{name}' to schema with columns: {list(df.columns)}"
-            )
-            for column in df.columns:
-                data_type = df[column].dtype
-                sql_data_type = python_to_sql_type(data_type)
-
-                table.addColumn(column, sql_data_type)
-
-            schema.addTable(table)
+        # Every call into java is costly, so we collect
+        # tables, columns and functions and hand them over at once
+        tables = [self._prepare_table(name, dc) for name, dc in self.tables.items()]
+        schema.addTables(jpype.JArray(DaskTable)(tables))
 
         if not self.functions:
             logger.debug("No custom functions defined.")
 
+        functions = []
         for function_description in self.function_list:
             name = function_description.name
-            sql_return_type = python_to_sql_type(function_description.return_type)
+            sql_return_type = function_description.sql_return_type
             if function_description.aggregation:
                 logger.debug(f"Adding function '{name}' to schema as aggregation.")
                 dask_function = DaskAggregateFunction(name, sql_return_type)
@@ -478,43 +525,69 @@ class Context:
                 function_description, dask_function
             )
 
-            schema.addFunction(dask_function)
+            functions.append(dask_function)
+
+        schema.addFunctions(jpype.JArray(DaskFunction)(functions))
 
+        self._cached_schema = schema
+        self._cached_schema_version = self._schema_version
         return schema
 
     @staticmethod
-    def _add_parameters_from_description(function_description, dask_function):
-        for parameter in function_description.parameters:
-            param_name, param_type = parameter
-            sql_param_type = python_to_sql_type(param_type)
+    def _prepare_table(name: str, dc: DataContainer):
+        """Create a calcite table with the columns of the given data container"""
+        assert name == name.lower(), "Table names need to be lower case"
+        table = DaskTable(name)
+        df = dc.df
+        logger.debug(
+            f"Adding table '{name}' to schema with columns: {list(df.columns)}"
+        )
 
+        column_names = []
+        sql_data_types = []
+        for column, data_type in df.dtypes.items():
+            column_names.append(column)
+            sql_data_types.append(python_to_sql_type(data_type))
+
+        table.addColumns(
+            jpype.JArray(jpype.JString)(column_names),
+            jpype.JArray(SqlTypeName)(sql_data_types),
+        )
+        return table
+
+    @staticmethod
+    def _add_parameters_from_description(function_description, dask_function):
+        for param_name, sql_param_type in function_description.sql_parameters:
             dask_function.addParameter(param_name, sql_param_type, False)
 
         return dask_function
 
-    def _get_ral(self, sql):
-        """Helper function to turn the sql query into a relational algebra and resulting column names"""
-        # get the schema of what we currently have registered
-        schema = self._prepare_schema()
+    def _get_generator(self):
+        """
+        Return a generator for the relational algebra
+        using the schema of what we currently have registered.
+        Setting up calcite is costly, so the generator
+        is reused until the schema changes.
+        """
+        if self._cached_generator_version != self._schema_version:
+            schema = self._prepare_schema()
+            self._cached_generator = RelationalAlgebraGenerator(schema)
+            self._cached_generator_version = self._schema_version
 
-        # Now create a relational algebra from that
-        generator = RelationalAlgebraGenerator(schema)
-        default_dialect = generator.getDialect()
+        return self._cached_generator
 
-        logger.debug(f"Using dialect: {get_java_class(default_dialect)}")
+    def _get_ral(self, sql):
+        """Helper function to turn the sql query into a relational algebra and resulting column names"""
+        # Creating the relational algebra does not depend on anything
+        # else than the query and the schema, so we can reuse the
+        # result of an earlier call
+        cached_result = self._plan_cache.get(sql)
+        if cached_result is not None:
+            logger.debug("Reusing cached relational algebra")
+            return cached_result
 
         try:
-            sqlNode = generator.getSqlNode(sql)
-            sqlNodeClass = get_java_class(sqlNode)
-
-            if sqlNodeClass.startswith("com.dask.sql.parser."):
-                rel = sqlNode
-                rel_string = ""
-            else:
-                validatedSqlNode = generator.getValidatedNode(sqlNode)
-                nonOptimizedRelNode = generator.getRelationalAlgebra(validatedSqlNode)
-                rel = generator.getOptimizedRelationalAlgebra(nonOptimizedRelNode)
-                rel_string = str(generator.getRelationalAlgebraString(rel))
+            rel, select_names, rel_string = self._plan(sql)
         except (ValidationException, SqlParseException) as e:
             logger.debug(f"Original exception raised by Java:\n {e}")
             # We do not want to re-raise an exception here
@@ -523,39 +596,86 @@ class Context:
             # Instead, we raise a nice exception
             raise ParsingException(sql, str(e.message())) from None
 
+        self._plan_cache.put(sql, (rel, select_names, rel_string))
+        return rel, select_names, rel_string
+
+    def _plan(self, sql):
+        """
+        Create the relational algebra (and resulting column names) of the
+        sql query with calcite. Other than _get_ral, this neither uses the cache
+        nor converts the java exceptions on invalid sql queries.
+        """
+        # Now create a relational algebra from what we currently have registered.
+        # Parsing, validation, optimization and the extraction of the
+        # column names all happen in a single call to java.
+        generator = self._get_generator()
+        result = generator.planAndExtract(sql)
+
+        rel = result.getPlan()
+        rel_string = str(result.getRelationalAlgebraString())
+
         # Internal, temporary results of calcite are sometimes
         # named EXPR$N (with N a number), which is not very helpful
         # to the user. We replace these cases therefore with
-        # the actual query string. This logic probably fails in some
-        # edge cases (if the outer SQLNode is not a select node),
-        # but so far I did not find such a case.
-        # So please raise an issue if you have found one!
-        if sqlNodeClass == "org.apache.calcite.sql.SqlOrderBy":
-            sqlNode = sqlNode.query
-            sqlNodeClass = get_java_class(sqlNode)
-
-        if sqlNodeClass == "org.apache.calcite.sql.SqlSelect":
-            select_names = [
-                self._to_sql_string(s, default_dialect=default_dialect)
-                for s in sqlNode.getSelectList()
-            ]
+        # the names of the select list items (if this is a select)
+        select_names = result.getSelectNames()
+        if select_names is not None:
+            select_names = [str(name) for name in select_names]
         else:
             logger.debug(
                 "Not extracting output column names as the SQL is not a SELECT call"
             )
-            select_names = None
 
         logger.debug(f"Extracted relational algebra:\n {rel_string}")
         return rel, select_names, rel_string
 
     def _to_sql_string(self, s: "org.apache.calcite.sql.SqlNode", default_dialect=None):
         if default_dialect is None:
-            schema = self._prepare_schema()
-
-            generator = RelationalAlgebraGenerator(schema)
+            generator = self._get_generator()
             default_dialect = generator.getDialect()
 
         try:
             return str(s.toSqlString(default_dialect))
         except:  # pragma: no cover. Have not seen any instance so far, but better be safe than sorry.
             return str(s)
+
+
+def _register_default_plugins():
+    """
+    Register any default plugins, if nothing was registered before.
+    This only needs to happen once (and not for every new context),
+    so it is done when this module is loaded.
+    """
+    RelConverter.add_plugin_class(logical.LogicalAggregatePlugin, replace=False)
+    RelConverter.add_plugin_class(logical.LogicalFilterPlugin, replace=False)
+    RelConverter.add_plugin_class(logical.LogicalJoinPlugin, replace=False)
+    RelConverter.add_plugin_class(logical.LogicalProjectPlugin, replace=False)
+    RelConverter.add_plugin_class(logical.LogicalSortPlugin, replace=False)
+    RelConverter.add_plugin_class(logical.LogicalTableScanPlugin, replace=False)
+    RelConverter.add_plugin_class(logical.LogicalUnionPlugin, replace=False)
+    RelConverter.add_plugin_class(logical.LogicalValuesPlugin, replace=False)
+    RelConverter.add_plugin_class(logical.SamplePlugin, replace=False)
+    RelConverter.add_plugin_class(custom.AnalyzeTablePlugin, replace=False)
+    RelConverter.add_plugin_class(custom.CreateModelPlugin, replace=False)
+    RelConverter.add_plugin_class(custom.CreateTableAsPlugin, replace=False)
+    RelConverter.add_plugin_class(custom.CreateTablePlugin, replace=False)
+    RelConverter.add_plugin_class(custom.PredictModelPlugin, replace=False)
+    RelConverter.add_plugin_class(custom.DropModelPlugin, replace=False)
+    RelConverter.add_plugin_class(custom.DropTablePlugin, replace=False)
+    RelConverter.add_plugin_class(custom.ShowColumnsPlugin, replace=False)
+    RelConverter.add_plugin_class(custom.ShowSchemasPlugin, replace=False)
+    RelConverter.add_plugin_class(custom.ShowTablesPlugin, replace=False)
+
+    RexConverter.add_plugin_class(core.RexCallPlugin, replace=False)
+    RexConverter.add_plugin_class(core.RexInputRefPlugin, replace=False)
+    RexConverter.add_plugin_class(core.RexLiteralPlugin, replace=False)
+
+    InputUtil.add_plugin_class(input_utils.DaskInputPlugin, replace=False)
+    InputUtil.add_plugin_class(input_utils.PandasInputPlugin, replace=False)
+    InputUtil.add_plugin_class(input_utils.HiveInputPlugin, replace=False)
+    InputUtil.add_plugin_class(input_utils.IntakeCatalogInputPlugin, replace=False)
+    # needs to be the last entry, as it only checks for string
+    InputUtil.add_plugin_class(input_utils.LocationInputPlugin, replace=False)
+
+
+_register_default_plugins()
@@ -1,4 +1,5 @@
-from typing import List, Dict, Tuple, Union
+from typing import Any, List, Dict, NamedTuple, Tuple, Union
+import copy
 
 import dask.dataframe as dd
 
@@ -6,6 +7,17 @@ import dask.dataframe as dd
 ColumnType = Union[str, int]
 
 
+class ParquetSource(NamedTuple):
+    """
+    Location and read arguments of a table, which is read
+    lazily from parquet files. With this information, the table
+    can be read again, e.g. with additional filters.
+    """
+
+    location: str
+    kwargs: Dict[str, Any]
+
+
 class ColumnContainer:
     # Forward declaration
     pass
@@ -156,9 +168,25 @@ class DataContainer:
     and "backend" (what dask has).
     """
 
-    def __init__(self, df: dd.DataFrame, column_container: ColumnContainer):
+    def __init__(
+        self,
+        df: dd.DataFrame,
+        column_container: ColumnContainer,
+        parquet_source: Union[ParquetSource, None] = None,
+    ):
         self.df = df
         self.column_container = column_container
+        # Only set for registered tables which are read lazily from parquet
+        self.parquet_source = parquet_source
+
+    def with_columns(self, column_container: ColumnContainer) -> "DataContainer":
+        """
+        Return a new DataContainer with the same data (and all other
+        stored information), but the given column container.
+        """
+        dc = copy.copy(self)
+        dc.column_container = column_container
+        return dc
 
     def assign(self) -> dd.DataFrame:
         """
@@ -166,11 +194,22 @@ class DataContainer:
         a dataframe which has the the columns specified in the
         stored ColumnContainer.
         """
-        df = self.df.assign(
-            **{
-                col_from: self.df[col_to]
-                for col_from, col_to in self.column_container.mapping()
-                if col_from in self.column_container.columns
-            }
-        )
-        return df[self.column_container.columns]
+        columns = self.column_container.columns
+        frontend_columns = set(columns)
+
+        # Columns which are already stored under their frontend name
+        # do not need to be assigned again
+        renames = {
+            col_from: self.df[col_to]
+            for col_from, col_to in self.column_container.mapping()
+            if col_from in frontend_columns and col_from != col_to
+        }
+        df = self.df.assign(**renames) if renames else self.df
+
+        if list(df.columns) == columns:
+            # Nothing to select or reorder. Dask dataframes can be changed
+            # inplace, so we still never hand out the stored dataframe itself.
+            # The copy is cheap, as it does not copy the graph.
+            return df.copy() if df is self.df else df
+
+        return df[columns]
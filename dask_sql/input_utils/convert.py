@@ -7,6 +7,7 @@ import pandas as pd
 
 from dask_sql.datacontainer import DataContainer, ColumnContainer
 from dask_sql.input_utils.base import BaseInputPlugin
+from dask_sql.input_utils.location import LocationInputPlugin
 
 logger = logging.Logger(__name__)
 
@@ -55,21 +56,48 @@ class InputUtil(Pluggable):
 
         if persist:
             table = table.persist()
+        elif table is input_item:
+            # dask dataframes can be changed inplace (e.g. by assigning
+            # a new column), so we do not want to store the user's object.
+            # Persisting or loading already returns a new object, so
+            # we only need to copy (just the object, not the graph) here.
+            table = table.copy()
 
-        return DataContainer(table.copy(), ColumnContainer(table.columns))
+        parquet_source = None
+        if not persist and not isinstance(input_item, list):
+            # Only remember the source of the data, if it is read lazily
+            # with read_parquet, so that it can be read again with filters
+            plugin = cls._get_plugin(
+                input_item, table_name=table_name, format=format, **kwargs
+            )
+            if isinstance(plugin, LocationInputPlugin):
+                parquet_source = plugin.get_parquet_source(
+                    input_item, format=format, **kwargs
+                )
+
+        return DataContainer(
+            table, ColumnContainer(table.columns), parquet_source=parquet_source
+        )
 
     @classmethod
     def _get_dask_dataframe(
         cls, input_item: InputType, table_name: str, format: str = None, **kwargs,
     ):
+        plugin = cls._get_plugin(
+            input_item, table_name=table_name, format=format, **kwargs
+        )
+        return plugin.to_dc(input_item, table_name=table_name, format=format, **kwargs)
+
+    @classmethod
+    def _get_plugin(
+        cls, input_item: InputType, table_name: str, format: str = None, **kwargs,
+    ) -> BaseInputPlugin:
         plugin_list = cls.get_plugins()
 
         for plugin in plugin_list:
             if plugin.is_correct_input(
                 input_item, table_name=table_name, format=format, **kwargs
             ):
-                return plugin.to_dc(
-                    input_item, table_name=table_name, format=format, **kwargs
-                )
+                return plugin
 
         raise ValueError(f"Do not understand the input type {type(input_item)}")
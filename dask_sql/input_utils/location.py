@@ -1,9 +1,10 @@
 import os
-from typing import Any
+from typing import Any, Union
 
 import dask.dataframe as dd
 from distributed.client import default_client
 
+from dask_sql.datacontainer import ParquetSource
 from dask_sql.input_utils.base import BaseInputPlugin
 
 
@@ -21,10 +22,7 @@ class LocationInputPlugin(BaseInputPlugin):
             client = default_client()
             return client.get_dataset(input_item, **kwargs)
 
-        if not format:
-            _, extension = os.path.splitext(input_item)
-
-            format = extension.lstrip(".")
+        format = self._get_format(input_item, format)
 
         try:
             read_function = getattr(dd, f"read_{format}")
@@ -32,3 +30,25 @@ class LocationInputPlugin(BaseInputPlugin):
             raise AttributeError(f"Can not read files of format {format}")
 
         return read_function(input_item, **kwargs)
+
+    def get_parquet_source(
+        self, input_item: str, format: str = None, **kwargs
+    ) -> Union[ParquetSource, None]:
+        """
+        Return the location and read arguments, if the input
+        is read with dask's read_parquet (without own filters),
+        so that it can be read again later with additional filters.
+        """
+        if "filters" in kwargs or self._get_format(input_item, format) != "parquet":
+            return None
+
+        return ParquetSource(input_item, dict(kwargs))
+
+    @staticmethod
+    def _get_format(input_item: str, format: str = None) -> str:
+        if not format:
+            _, extension = os.path.splitext(input_item)
+
+            format = extension.lstrip(".")
+
+        return format
@@ -86,6 +86,7 @@ org = jpype.JPackage("org")
 java = jpype.JPackage("java")
 
 DaskTable = com.dask.sql.schema.DaskTable
+DaskFunction = com.dask.sql.schema.DaskFunction
 DaskAggregateFunction = com.dask.sql.schema.DaskAggregateFunction
 DaskScalarFunction = com.dask.sql.schema.DaskScalarFunction
 DaskSchema = com.dask.sql.schema.DaskSchema
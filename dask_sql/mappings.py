@@ -1,4 +1,5 @@
 from typing import Any
+from functools import lru_cache
 import logging
 
 import pandas as pd
@@ -77,8 +78,13 @@ _SQL_TO_PYTHON_FRAMES = {
 }
 
 
+@lru_cache(maxsize=None)
 def python_to_sql_type(python_type):
-    """Mapping between python and SQL types."""
+    """
+    Mapping between python and SQL types.
+    As the same dtypes appear over and over again
+    in the registered tables, the result is cached.
+    """
 
     if isinstance(python_type, np.dtype):
         python_type = python_type.type
@@ -1,12 +1,15 @@
-from typing import Union
+from typing import Any, List, Tuple, Union
 import logging
 
 import dask.dataframe as dd
 import numpy as np
 
+from dask_sql.java import get_java_class, org
+from dask_sql.mappings import sql_to_python_value
 from dask_sql.physical.rex import RexConverter
 from dask_sql.physical.rel.base import BaseRelPlugin
-from dask_sql.datacontainer import DataContainer
+from dask_sql.physical.rel.logical.table_scan import LogicalTableScanPlugin
+from dask_sql.datacontainer import ColumnContainer, DataContainer
 
 
 logger = logging.getLogger(__name__)
@@ -29,6 +32,63 @@ def filter_or_scalar(df: dd.DataFrame, filter_condition: Union[np.bool_, dd.Seri
     return df[filter_condition]
 
 
+# Comparisons which can be passed as filters to dask's read_parquet
+# together with the operation, if the literal is on the left side
+_PARQUET_FILTER_OPERATIONS = {
+    "EQUALS": ("==", "=="),
+    "NOT_EQUALS": ("!=", "!="),
+    "LESS_THAN": ("<", ">"),
+    "LESS_THAN_OR_EQUAL": ("<=", ">="),
+    "GREATER_THAN": (">", "<"),
+    "GREATER_THAN_OR_EQUAL": (">=", "<="),
+}
+
+
+def to_parquet_filters(
+    condition: "org.apache.calcite.rex.RexNode", cc: ColumnContainer
+) -> List[Tuple[str, str, Any]]:
+    """
+    Turn as much as possible of the filter condition into the
+    filters understood by dask's read_parquet, which are a list
+    of (column, operation, value) tuples combined with AND.
+    Only comparisons between a column and a literal
+    (maybe combined with AND) are supported - everything
+    else is left out. This is fine, as the filters are only used
+    to skip reading data, the condition still needs to be applied
+    completely afterwards.
+    """
+    rex_ns = org.apache.calcite.rex
+    kind = str(condition.getKind())
+
+    if kind == "AND":
+        return sum(
+            (to_parquet_filters(operand, cc) for operand in condition.getOperands()),
+            [],
+        )
+
+    if kind not in _PARQUET_FILTER_OPERATIONS:
+        return []
+
+    lhs, rhs = condition.getOperands()
+    operation, flipped_operation = _PARQUET_FILTER_OPERATIONS[kind]
+    if isinstance(lhs, rex_ns.RexLiteral) and isinstance(rhs, rex_ns.RexInputRef):
+        lhs, rhs = rhs, lhs
+        operation = flipped_operation
+    if not (isinstance(lhs, rex_ns.RexInputRef) and isinstance(rhs, rex_ns.RexLiteral)):
+        return []
+
+    value = sql_to_python_value(str(rhs.getType()), rhs.getValue())
+    if isinstance(value, np.generic):
+        value = value.item()
+    # Other types (e.g. timestamps) might not be comparable
+    # with the values stored in the parquet files
+    if not isinstance(value, (bool, int, float, str)) or value != value:
+        return []
+
+    column = cc.get_backend_by_frontend_index(lhs.getIndex())
+    return [(column, operation, value)]
+
+
 class LogicalFilterPlugin(BaseRelPlugin):
     """
     LogicalFilter is used on WHERE clauses.
@@ -41,6 +101,7 @@ class LogicalFilterPlugin(BaseRelPlugin):
         self, rel: "org.apache.calcite.rel.RelNode", context: "dask_sql.Context"
     ) -> DataContainer:
         (dc,) = self.assert_inputs(rel, 1, context)
+        dc = self._push_down_to_parquet(rel, dc, context)
         df = dc.df
         cc = dc.column_container
 
@@ -53,3 +114,34 @@ class LogicalFilterPlugin(BaseRelPlugin):
         cc = self.fix_column_to_row_type(cc, rel.getRowType())
         # No column type has changed, so no need to convert again
         return DataContainer(df, cc)
+
+    def _push_down_to_parquet(
+        self,
+        rel: "org.apache.calcite.rel.RelNode",
+        dc: DataContainer,
+        context: "dask_sql.Context",
+    ) -> DataContainer:
+        """
+        If the input is a table read lazily from parquet, read it again
+        with the filter condition passed to read_parquet. This allows
+        dask to skip reading all the data which can not match anyways.
+        """
+        (input_rel,) = rel.getInputs()
+        if get_java_class(input_rel) != LogicalTableScanPlugin.class_name:
+            return dc
+
+        table_name = [str(n) for n in input_rel.getTable().getQualifiedName()][-1]
+        parquet_source = context.tables[table_name].parquet_source
+        if parquet_source is None:
+            return dc
+
+        cc = dc.column_container
+        filters = to_parquet_filters(rel.getCondition(), cc)
+        if not filters:
+            return dc
+
+        logger.debug(f"Reading {table_name} again with filters {filters}")
+        df = dd.read_parquet(
+            parquet_source.location, filters=filters, **parquet_source.kwargs
+        )
+        return self.fix_dtype_to_row_type(DataContainer(df, cc), input_rel.getRowType())
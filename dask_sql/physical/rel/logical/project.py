@@ -10,6 +10,8 @@ from dask_sql.java import org
 
 logger = logging.getLogger(__name__)
 
+RelOptUtil = org.apache.calcite.plan.RelOptUtil
+
 
 class LogicalProjectPlugin(BaseRelPlugin):
     """
@@ -29,6 +31,22 @@ class LogicalProjectPlugin(BaseRelPlugin):
         df = dc.df
         cc = dc.column_container
 
+        # Only keep the columns, which are referenced in this projection.
+        # The input might carry many more (e.g. all columns of a table),
+        # which would otherwise be dragged along through all following steps.
+        # Selecting them directly also allows dask to only read the needed
+        # columns from disk, if the input is a table scan.
+        used_columns = list(
+            dict.fromkeys(
+                cc.get_backend_by_frontend_index(int(index))
+                for index in RelOptUtil.InputFinder.bits(rel.getProjects(), None)
+            )
+        )
+        if used_columns and len(used_columns) < len(df.columns):
+            logger.debug(f"Only keeping the columns {used_columns}")
+            df = df[used_columns]
+            dc = DataContainer(df, cc)
+
         # Collect all (new) columns
         named_projects = rel.getNamedProjects()
 
@@ -31,11 +31,12 @@ class LogicalTableScanPlugin(BaseRelPlugin):
         # We assume to always have the form something.something
         # And the first something is fixed to "schema" by the context
         # For us, it makes no difference anyways.
+        # The table names are already lower case, as we
+        # only register lower case names in the schema.
         table_names = [str(n) for n in table.getQualifiedName()]
         assert table_names[0] == context.schema_name
         assert len(table_names) == 2
         table_name = table_names[1]
-        table_name = table_name.lower()
 
         dc = context.tables[table_name]
         df = dc.df
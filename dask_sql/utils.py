@@ -1,7 +1,7 @@
 from typing import List
 import importlib
-from typing import Any, Dict
-from collections import defaultdict
+from typing import Any, Dict, Hashable
+from collections import OrderedDict, defaultdict
 import re
 from datetime import datetime
 import logging
@@ -192,6 +192,50 @@ class LoggableDataFrame:
         return f"Literal: {df}"
 
 
+class PlanCache:
+    """
+    Small LRU cache for the results of turning SQL strings
+    into relational algebra.
+    Creating the plan with calcite is pure (but costly) planning work,
+    so queries issued repeatedly can reuse the result.
+    The cache does not know anything about the schema:
+    it is the job of the owner to clear it, whenever the
+    registered tables or functions change.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for the key (or None) and mark it as recently used"""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        """Store the value and evict the least recently used entries if needed"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def get_table_from_compound_identifier(
     context: "dask_sql.Context", components: List[str]
 ) -> DataContainer:
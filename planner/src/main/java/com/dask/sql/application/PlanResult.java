@@ -0,0 +1,38 @@
+package com.dask.sql.application;
+
+/**
+ * The result of planning a SQL query with the RelationalAlgebraGenerator.
+ *
+ * Bundles everything dask_sql needs to know about a query, so that it can be
+ * returned with a single call.
+ */
+public class PlanResult {
+	/// The optimized rel node - or the sql node for custom statements
+	private final Object plan;
+	/// The names of the selected columns (or null, if this is not a SELECT)
+	private final String[] selectNames;
+	/// The string representation of the relational algebra
+	private final String relationalAlgebraString;
+
+	/// Create a new result
+	public PlanResult(final Object plan, final String[] selectNames, final String relationalAlgebraString) {
+		this.plan = plan;
+		this.selectNames = selectNames;
+		this.relationalAlgebraString = relationalAlgebraString;
+	}
+
+	/// Return the optimized rel node (or the sql node for custom statements)
+	public Object getPlan() {
+		return this.plan;
+	}
+
+	/// Return the names of the selected columns (or null)
+	public String[] getSelectNames() {
+		return this.selectNames;
+	}
+
+	/// Return the string representation of the relational algebra
+	public String getRelationalAlgebraString() {
+		return this.relationalAlgebraString;
+	}
+}
@@ -38,7 +38,13 @@ import org.apache.calcite.rel.rules.ReduceExpressionsRule;
 import org.apache.calcite.rel.type.RelDataTypeSystem;
 import org.apache.calcite.rex.RexExecutorImpl;
 import org.apache.calcite.schema.SchemaPlus;
+import org.apache.calcite.sql.SqlCall;
+import org.apache.calcite.sql.SqlIdentifier;
+import org.apache.calcite.sql.SqlKind;
 import org.apache.calcite.sql.SqlNode;
+import org.apache.calcite.sql.SqlNodeList;
+import org.apache.calcite.sql.SqlOrderBy;
+import org.apache.calcite.sql.SqlSelect;
 import org.apache.calcite.sql.SqlOperatorTable;
 import org.apache.calcite.sql.fun.SqlLibrary;
 import org.apache.calcite.sql.fun.SqlLibraryOperatorTableFactory;
@@ -59,12 +65,15 @@ import org.apache.calcite.tools.ValidationException;
  * query strings or throws an exception.
  *
  * This class is taken (in parts) from the blazingSQL project.
+ *
+ * A generator can be reused for multiple queries (one after the other), as
+ * long as the schema does not change.
  */
 public class RelationalAlgebraGenerator {
 	/// The created planner
 	private Planner planner;
-	/// The planner for optimized queries
-	private HepPlanner hepPlanner;
+	/// The framework config, used to create a new optimizer for each query
+	private FrameworkConfig config;
 
 	/// Create a new relational algebra generator from a schema
 	public RelationalAlgebraGenerator(final DaskSchema schema) throws ClassNotFoundException, SQLException {
@@ -76,10 +85,9 @@ public class RelationalAlgebraGenerator {
 		final SchemaPlus rootSchema = calciteConnection.getRootSchema();
 		rootSchema.add(schema.getName(), schema);
 
-		final FrameworkConfig config = getConfig(rootSchema, schema.getName());
+		config = getConfig(rootSchema, schema.getName());
 
 		planner = Frameworks.getPlanner(config);
-		hepPlanner = getHepPlanner(config);
 	}
 
 	/// Create the framework config, e.g. containing with SQL dialect we speak
@@ -158,6 +166,9 @@ public class RelationalAlgebraGenerator {
 
 	/// Parse a sql string into a sql tree
 	public SqlNode getSqlNode(final String sql) throws SqlParseException {
+		// The last query might have stopped after parsing (e.g. for custom
+		// statements), so make sure we start from a fresh planner state
+		planner.close();
 		try {
 			return planner.parse(sql);
 		} catch (final SqlParseException e) {
@@ -188,6 +199,8 @@ public class RelationalAlgebraGenerator {
 
 	/// Turn a non-optimized algebra into an optimized one
 	public RelNode getOptimizedRelationalAlgebra(final RelNode nonOptimizedPlan) {
+		// The hep planner keeps the graph of the last query, so we need a new one
+		final HepPlanner hepPlanner = getHepPlanner(config);
 		hepPlanner.setRoot(nonOptimizedPlan);
 		planner.close();
 
@@ -198,4 +211,74 @@ public class RelationalAlgebraGenerator {
 	public String getRelationalAlgebraString(final RelNode relNode) {
 		return RelOptUtil.toString(relNode);
 	}
+
+	/**
+	 * Parse, validate and optimize the given sql string and extract the names of
+	 * the selected columns - all in a single call. Custom statements (from
+	 * com.dask.sql.parser) are only parsed, as they are handled by dask_sql
+	 * directly.
+	 */
+	public PlanResult planAndExtract(final String sql)
+			throws SqlParseException, ValidationException, RelConversionException {
+		final SqlNode sqlNode = getSqlNode(sql);
+
+		if (sqlNode.getClass().getName().startsWith("com.dask.sql.parser.")) {
+			return new PlanResult(sqlNode, null, "");
+		}
+
+		final SqlNode validatedSqlNode = getValidatedNode(sqlNode);
+		final RelNode nonOptimizedRelNode = getRelationalAlgebra(validatedSqlNode);
+		final RelNode rel = getOptimizedRelationalAlgebra(nonOptimizedRelNode);
+
+		return new PlanResult(rel, getSelectNames(sqlNode), getRelationalAlgebraString(rel));
+	}
+
+	/**
+	 * Internal, temporary results of calcite are sometimes named EXPR$N (with N a
+	 * number), which is not very helpful to the user. We therefore return the
+	 * names of the select list items, so that dask_sql can replace them. This
+	 * logic probably fails in some edge cases (if the outer SQLNode is not a
+	 * select node), but so far no such case is known.
+	 */
+	private String[] getSelectNames(SqlNode sqlNode) {
+		if (sqlNode instanceof SqlOrderBy) {
+			sqlNode = ((SqlOrderBy) sqlNode).query;
+		}
+
+		if (!(sqlNode instanceof SqlSelect)) {
+			return null;
+		}
+
+		final SqlNodeList selectList = ((SqlSelect) sqlNode).getSelectList();
+		final String[] selectNames = new String[selectList.size()];
+		for (int i = 0; i < selectNames.length; i++) {
+			selectNames[i] = getSelectName(selectList.get(i));
+		}
+		return selectNames;
+	}
+
+	/**
+	 * Column references and aliased items are named directly from the tree, only
+	 * more complex expressions need to be turned into a sql string.
+	 */
+	private String getSelectName(final SqlNode selectItem) {
+		if (selectItem instanceof SqlIdentifier) {
+			final List<String> names = ((SqlIdentifier) selectItem).names;
+			return names.get(names.size() - 1);
+		}
+
+		if (selectItem.getKind() == SqlKind.AS) {
+			final SqlNode alias = ((SqlCall) selectItem).operand(1);
+			if (alias instanceof SqlIdentifier && ((SqlIdentifier) alias).isSimple()) {
+				return ((SqlIdentifier) alias).getSimple();
+			}
+		}
+
+		try {
+			return selectItem.toSqlString(getDialect()).getSql();
+		} catch (final Exception e) {
+			// Have not seen any instance so far, but better be safe than sorry.
+			return selectItem.toString();
+		}
+	}
 }
@@ -48,6 +48,13 @@ public class DaskSchema implements Schema {
 		this.databaseTables.put(table.getTableName(), table);
 	}
 
+	/// Add multiple already created tables at once
+	public void addTables(final DaskTable[] tables) {
+		for (final DaskTable table : tables) {
+			this.addTable(table);
+		}
+	}
+
 	/// Add an already created scalar function to the list
 	public void addFunction(final DaskScalarFunction function) {
 		this.functions.add(function);
@@ -58,6 +65,13 @@ public class DaskSchema implements Schema {
 		this.functions.add(function);
 	}
 
+	/// Add multiple already created (scalar or aggregate) functions at once
+	public void addFunctions(final DaskFunction[] functions) {
+		for (final DaskFunction function : functions) {
+			this.functions.add(function);
+		}
+	}
+
 	/// Get the name of this schema
 	public String getName() {
 		return this.name;
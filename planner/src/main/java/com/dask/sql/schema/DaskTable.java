@@ -40,6 +40,14 @@ public class DaskTable implements ProjectableFilterableTable {
 		this.tableColumns.add(new Pair<>(columnName, columnType));
 	}
 
+	/// Add multiple columns at once (to reduce the number of calls from python)
+	public void addColumns(final String[] columnNames, final SqlTypeName[] columnTypes) {
+		assert columnNames.length == columnTypes.length;
+		for (int i = 0; i < columnNames.length; i++) {
+			this.addColumn(columnNames[i], columnTypes[i]);
+		}
+	}
+
 	/// return the table name
 	public String getTableName() {
 		return this.name;
@@ -1,5 +1,9 @@
+import dask.dataframe as dd
+import pandas as pd
 from pandas.testing import assert_frame_equal
 
+from dask_sql import Context
+
 
 def test_filter(c, df):
     return_df = c.sql("SELECT * FROM df WHERE a < 2")
@@ -43,3 +47,33 @@ def test_filter_complicated(c, df):
     assert_frame_equal(
         return_df, expected_df,
     )
+
+
+def test_filter_parquet(tmpdir, monkeypatch):
+    c = Context()
+
+    df = pd.DataFrame({"a": [1, 2, 3] * 10, "b": ["x", "y", "z"] * 10})
+    dd.from_pandas(df, npartitions=3).to_parquet(str(tmpdir))
+
+    c.create_table("parquet_df", str(tmpdir), format="parquet", persist=False)
+    assert c.tables["parquet_df"].parquet_source is not None
+
+    read_parquet = dd.read_parquet
+    read_parquet_calls = []
+
+    def mock_read_parquet(*args, **kwargs):
+        read_parquet_calls.append(kwargs)
+        return read_parquet(*args, **kwargs)
+
+    monkeypatch.setattr(dd, "read_parquet", mock_read_parquet)
+
+    return_df = c.sql(
+        "SELECT * FROM parquet_df WHERE a > 1 AND 'y' = b AND a + 1 > 2"
+    ).compute()
+
+    expected_df = df[(df["a"] > 1) & (df["b"] == "y")]
+    assert_frame_equal(
+        return_df.reset_index(drop=True), expected_df.reset_index(drop=True)
+    )
+    assert len(read_parquet_calls) == 1
+    assert read_parquet_calls[0]["filters"] == [("a", ">", 1), ("b", "==", "y")]
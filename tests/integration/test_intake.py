@@ -76,3 +76,38 @@ def test_intake_sql(intake_catalog_location):
     )
 
     check_read_table(c)
+
+
+def test_intake_parquet_location(tmpdir):
+    pytest.importorskip("intake_parquet")
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [1.5, 2.5, 3.5]})
+    df.to_parquet(os.path.join(tmpdir, "data.parquet"))
+
+    yaml_location = os.path.join(tmpdir, "catalog.yaml")
+    with open(yaml_location, "w") as f:
+        f.write(
+            """sources:
+    intake_table:
+        args:
+            urlpath: "{{ CATALOG_DIR }}/data.parquet"
+        description: "Some Data"
+        driver: parquet
+        """
+        )
+
+    c = Context()
+    c.create_table(
+        "df",
+        yaml_location,
+        format="intake",
+        intake_table_name="intake_table",
+        persist=False,
+    )
+    # The catalog itself can not be read with read_parquet
+    assert c.tables["df"].parquet_source is None
+
+    result_df = c.sql("SELECT * FROM df WHERE a > 1").compute()
+    assert_frame_equal(
+        result_df.reset_index(drop=True), df[df["a"] > 1].reset_index(drop=True)
+    )
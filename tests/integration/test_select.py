@@ -117,3 +117,32 @@ def test_timezones(c, datetime_table):
     result_df = result_df.compute()
 
     assert_frame_equal(result_df, datetime_table)
+
+
+def test_select_prunes_columns(c):
+    from dask_sql.physical.rel import RelConverter
+
+    wide_df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6], "d": [7, 8]})
+    c.create_table("wide_df", dd.from_pandas(wide_df, npartitions=1))
+
+    def convert(sql):
+        rel, _, _ = c._get_ral(sql)
+        return RelConverter.convert(rel, context=c)
+
+    # Only the referenced columns are kept in the dataframe
+    dc = convert("SELECT b, a + d AS x FROM wide_df")
+    x_column = dc.column_container.get_backend_by_frontend_name("x")
+    assert set(dc.df.columns) == {"a", "b", "d", x_column}
+    assert_frame_equal(dc.assign().compute(), pd.DataFrame({"b": [3, 4], "x": [8, 12]}))
+
+    # Swapped references still point to the correct columns
+    dc = convert("SELECT b AS a, a AS b FROM wide_df")
+    assert list(dc.df.columns) == ["a", "b"]
+    assert_frame_equal(dc.assign().compute(), pd.DataFrame({"a": [3, 4], "b": [1, 2]}))
+
+    # Projections without any column reference do not prune everything
+    dc = convert("SELECT 1 AS x FROM wide_df")
+    assert len(dc.df.columns) > 0
+    result_df = dc.assign().compute()
+    assert list(result_df.columns) == ["x"]
+    assert list(result_df["x"]) == [1, 1]
@@ -2,6 +2,7 @@ import warnings
 import os
 
 import pytest
+import numpy as np
 import dask.dataframe as dd
 import pandas as pd
 from pandas.testing import assert_frame_equal
@@ -27,6 +28,16 @@ def test_add_remove_tables():
     assert "table" in c.tables
 
 
+def test_table_is_decoupled():
+    c = Context()
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+    c.create_table("df", data_frame, persist=False)
+
+    data_frame["b"] = data_frame["a"]
+    assert list(c.tables["df"].df.columns) == ["a"]
+
+
 def test_deprecation_warning():
     c = Context()
     data_frame = dd.from_pandas(pd.DataFrame(), npartitions=1)
@@ -72,6 +83,48 @@ def test_sql():
     assert isinstance(result, pd.DataFrame)
 
 
+def test_plan_cache():
+    c = Context()
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+    c.create_table("df", data_frame)
+
+    c.sql("SELECT * FROM df")
+    assert "SELECT * FROM df" in c._plan_cache
+
+    result = c.sql("SELECT * FROM df", return_futures=False)
+    assert_frame_equal(result, data_frame.compute())
+
+    # Changing the schema invalidates the cache
+    c.create_table("df", dd.from_pandas(pd.DataFrame({"b": [1]}), npartitions=1))
+    assert "SELECT * FROM df" not in c._plan_cache
+
+    result = c.sql("SELECT * FROM df", return_futures=False)
+    assert list(result.columns) == ["b"]
+
+
+def test_schema_cache():
+    c = Context()
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+    c.create_table("df", data_frame)
+
+    schema = c._prepare_schema()
+    assert c._prepare_schema() is schema
+    generator = c._get_generator()
+    assert c._get_generator() is generator
+
+    c.register_function(lambda x: x, "f", [("x", np.int64)], np.int64)
+    assert c._prepare_schema() is not schema
+    assert c._get_generator() is not generator
+
+    # The generator can be used for multiple queries, also if
+    # a query only needs to be parsed
+    c.sql(f'SHOW TABLES FROM "{c.schema_name}"')
+    c.sql("SELECT f(a) FROM df")
+    c.sql("SELECT a FROM df")
+
+
 def test_input_types(temporary_data_file):
     c = Context()
     df = pd.DataFrame({"a": [1, 2, 3]})
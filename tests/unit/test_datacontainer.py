@@ -1,3 +1,7 @@
+import dask.dataframe as dd
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
 from dask_sql.datacontainer import ColumnContainer, DataContainer
 
 
@@ -65,3 +69,32 @@ def test_cc_add():
     assert c2.mapping() == [("a", "b"), ("b", "b"), ("c", "c")]
     assert c.columns == ["a", "b", "c"]
     assert c.mapping() == [("a", "a"), ("b", "b"), ("c", "c")]
+
+
+def test_dc_assign():
+    df = dd.from_pandas(pd.DataFrame({"a": [1], "b": [2], "c": [3]}), npartitions=1)
+
+    dc = DataContainer(df, ColumnContainer(["a", "b", "c"]))
+    result = dc.assign()
+    assert result is not df
+    assert_frame_equal(result.compute(), df.compute())
+
+    cc = ColumnContainer(["a", "b", "c"])
+    cc = cc.rename({"a": "b", "b": "a"}).limit_to(["a", "b"])
+    result = DataContainer(df, cc).assign()
+
+    assert list(result.columns) == ["a", "b"]
+    assert_frame_equal(result.compute(), pd.DataFrame({"a": [2], "b": [1]}))
+
+
+def test_dc_with_columns():
+    df = dd.from_pandas(pd.DataFrame({"a": [1], "b": [2]}), npartitions=1)
+    cc = ColumnContainer(["a", "b"])
+    dc = DataContainer(df, cc)
+
+    cc2 = cc.rename({"a": "c"})
+    dc2 = dc.with_columns(cc2)
+
+    assert dc2.df is df
+    assert dc2.column_container is cc2
+    assert dc.column_container is cc
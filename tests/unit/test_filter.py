@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from dask_sql import Context
+from dask_sql.java import get_java_class
+from dask_sql.physical.rel.logical.filter import (
+    LogicalFilterPlugin,
+    to_parquet_filters,
+)
+
+
+@pytest.fixture()
+def c():
+    c = Context()
+
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": ["x", "y", "z"],
+            "c": pd.to_datetime(["2021-01-01", "2021-01-02", "2021-01-03"]),
+            "d": [1.5, 2.5, 3.5],
+        }
+    )
+    c.create_table("df", df)
+
+    return c
+
+
+def get_filters(c, sql):
+    rel, _, _ = c._get_ral(sql)
+    while get_java_class(rel) != LogicalFilterPlugin.class_name:
+        (rel,) = rel.getInputs()
+
+    cc = c.tables["df"].column_container
+    return to_parquet_filters(rel.getCondition(), cc)
+
+
+def test_comparisons(c):
+    assert get_filters(c, "SELECT * FROM df WHERE a > 1") == [("a", ">", 1)]
+    assert get_filters(c, "SELECT * FROM df WHERE b = 'y'") == [("b", "==", "y")]
+    assert get_filters(c, "SELECT * FROM df WHERE d <= 2.5") == [("d", "<=", 2.5)]
+    assert get_filters(c, "SELECT * FROM df WHERE a > 1 AND b <> 'z'") == [
+        ("a", ">", 1),
+        ("b", "!=", "z"),
+    ]
+
+
+def test_flipped_comparisons(c):
+    assert get_filters(c, "SELECT * FROM df WHERE 1 < a") == [("a", ">", 1)]
+    assert get_filters(c, "SELECT * FROM df WHERE 2 >= a") == [("a", "<=", 2)]
+    assert get_filters(c, "SELECT * FROM df WHERE 'y' = b") == [("b", "==", "y")]
+
+
+def test_unsupported_conditions(c):
+    assert get_filters(c, "SELECT * FROM df WHERE a > 1 OR b = 'y'") == []
+    assert get_filters(c, "SELECT * FROM df WHERE NOT (a > 1 AND b = 'y')") == []
+    assert get_filters(c, "SELECT * FROM df WHERE a + 1 > 2") == []
+    assert get_filters(c, "SELECT * FROM df WHERE a > 1 AND a + 1 > 2") == [
+        ("a", ">", 1)
+    ]
+
+
+def test_unsupported_literals(c):
+    assert get_filters(c, "SELECT * FROM df WHERE d > CAST('NaN' AS DOUBLE)") == []
+    assert (
+        get_filters(c, "SELECT * FROM df WHERE c > TIMESTAMP '2021-01-02 00:00:00'")
+        == []
+    )
@@ -6,6 +6,7 @@ from dask_sql.utils import (
     is_frame,
     Pluggable,
     ParsingException,
+    PlanCache,
 )
 from dask_sql.java import _set_or_check_java_home
 
@@ -59,6 +60,25 @@ def test_overwrite():
     assert PluginTest1().get_plugin("some_key") == "value_2"
 
 
+def test_plan_cache():
+    cache = PlanCache(maxsize=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    assert cache.get("c") is None
+
+    # b is the least recently used entry now
+    cache.put("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+
+
 def test_exception_parsing():
     e = ParsingException(
         "SELECT * FROM df",